@@ -107,7 +107,7 @@ def cmd_e2e_run(args):
                 image_tag,
                 "/bin/sh", "-c",  # Run a shell command inside the container
                 "find /component/dist/ -name '*.whl' | xargs -I {} echo '{}[devel]' | xargs pip install && " # Install whl package and dev dependencies
-                f"pytest -s --browser webkit --browser chromium --browser firefox --reruns 5 --capture=no"  # Run pytest
+                f"pytest -s -n auto --browser webkit --browser chromium --browser firefox --reruns 5 --capture=no"  # Run pytest
             ])
 
 
@@ -177,23 +177,24 @@ def cmd_example_check_deps(args):
 
 
 def cmd_check_test_utils(args):
-    """Check that e2e utils files are identical"""
-    file_list = glob.glob('**/e2e_utils.py', recursive=True)
-    if file_list:
-        reference_file = file_list[0]
-    else:
-        print("Cannot find e2e_utils.py files")
-        sys.exit(1)
-
-    for file_path in file_list:
-        run_verbose([
-            "git",
-            "--no-pager",
-            "diff",
-            "--no-index",
-            str(reference_file),
-            str(file_path),
-        ])
+    """Check that e2e utils and conftest files are identical"""
+    for file_name in ("e2e_utils.py", "conftest.py"):
+        file_list = glob.glob(f'**/e2e/{file_name}', recursive=True)
+        if file_list:
+            reference_file = file_list[0]
+        else:
+            print(f"Cannot find {file_name} files")
+            sys.exit(1)
+
+        for file_path in file_list:
+            run_verbose([
+                "git",
+                "--no-pager",
+                "diff",
+                "--no-index",
+                str(reference_file),
+                str(file_path),
+            ])
 
 
 class CookiecutterVariant(typing.NamedTuple):
@@ -1,7 +1,5 @@
 import os
 
-import pandas as pd
-
 import streamlit.components.v1 as components
 
 # Create a _RELEASE constant. We'll set this to False while we're developing
@@ -20,4 +18,8 @@ else:
 
 
 def custom_dataframe(data, key=None):
+    # pandas is only needed for the default value, so import it here to keep
+    # importing the package cheap.
+    import pandas as pd
+
     return _custom_dataframe(data=data, key=key, default=pd.DataFrame())
@@ -1,4 +1,4 @@
-import contextlib
+import http.client
 import logging
 import os
 import shlex
@@ -10,8 +10,6 @@ import typing
 from contextlib import closing
 from tempfile import TemporaryFile
 
-import requests
-
 
 LOGGER = logging.getLogger(__file__)
 
@@ -19,8 +17,9 @@ LOGGER = logging.getLogger(__file__)
 def _find_free_port():
     """Find and return a free port on the local machine."""
     with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("", 0))  # 0 means that the OS chooses a random port
+        # SO_REUSEADDR only has an effect when set before bind()
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(("", 0))  # 0 means that the OS chooses a random port
         return int(s.getsockname()[1])  # [1] contains the randomly selected port number
 
 
@@ -28,26 +27,28 @@ class AsyncSubprocess:
     """A context manager. Wraps subprocess. Popen to capture output safely."""
 
     def __init__(self, args: typing.List[str], cwd: typing.Optional[str] = None,
-                 env: typing.Optional[typing.Dict[str, str]] = None):
+                 env: typing.Optional[typing.Dict[str, str]] = None,
+                 capture_output: bool = True):
         """Initialize an AsyncSubprocess instance.
 
         Args:
             args (List[str]): List of command-line arguments.
             cwd (str, optional): Current working directory. Defaults to None.
             env (dict, optional): Environment variables. Defaults to None.
+            capture_output (bool, optional): Whether to capture stdout/stderr so
+                that terminate() can return it. Otherwise the output is
+                discarded. Defaults to True.
         """
         self.args = args
         self.cwd = cwd
         self.env = env
+        self.capture_output = capture_output
         self._proc = None
         self._stdout_file = None
 
     def terminate(self) -> typing.Optional[str]:
         """Terminate the process and return its stdout/stderr in a string."""
-        if self._proc is not None:
-            self._proc.terminate()
-            self._proc.wait()
-            self._proc = None
+        self._stop_process()
 
         # Read the stdout file and close it
         stdout = None
@@ -69,30 +70,51 @@ class AsyncSubprocess:
         self.stop()
 
     def start(self):
-        # Start the process and capture its stdout/stderr output to a temp
+        # Start the process and, if requested, capture its stdout/stderr to a temp
         # file. We do this instead of using subprocess.PIPE (which causes the
         # Popen object to capture the output to its own internal buffer),
         # because large amounts of output can cause it to deadlock.
-        self._stdout_file = TemporaryFile("w+")
-        LOGGER.info("Running command: %s", shlex.join(self.args))
+        if self.capture_output:
+            self._stdout_file = TemporaryFile("w+")
+            stdout = self._stdout_file
+        else:
+            stdout = subprocess.DEVNULL
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info("Running command: %s", shlex.join(self.args))
         self._proc = subprocess.Popen(
             self.args,
             cwd=self.cwd,
-            stdout=self._stdout_file,
+            stdout=stdout,
             stderr=subprocess.STDOUT,
             text=True,
-            env={**os.environ.copy(), **self.env} if self.env else None,
+            env={**os.environ, **self.env} if self.env else None,
         )
 
     def stop(self):
         """Terminate the subprocess and close resources."""
-        if self._proc is not None:
-            self._proc.terminate()
-            self._proc = None
+        self._stop_process()
         if self._stdout_file is not None:
             self._stdout_file.close()
             self._stdout_file = None
 
+    def _stop_process(self, timeout: float = 5):
+        """Terminate the process, killing it if it does not exit in time.
+
+        Args:
+            timeout (float, optional): Seconds to wait after SIGTERM before sending SIGKILL. Defaults to 5.
+        """
+        if self._proc is None:
+            return
+        try:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+        finally:
+            self._proc = None
+
 
 class StreamlitRunner:
     """A context manager for running Streamlit scripts."""
@@ -133,7 +155,9 @@ class StreamlitRunner:
                 "--server.headless=true",
                 "--browser.gatherUsageStats=false",
                 "--global.developmentMode=false",
-            ]
+                "--server.fileWatcherType=none",
+            ],
+            capture_output=False,
         )
         self._process.start()
         if not self.is_server_running():
@@ -148,21 +172,33 @@ class StreamlitRunner:
         """Check if the Streamlit server is running.
 
         Args:
-            timeout (int, optional): Maximum time to wait for the server to start. Defaults to 30.
+            timeout (int, optional): Maximum time in seconds to wait for the server to start. Defaults to 30.
 
         Returns:
             bool: True if the server is running, False otherwise.
         """
-        with requests.Session() as http_session:
-            start_time = time.time()
+        # The connection is kept alive between probes and only reopened
+        # after a failed one.
+        connection = http.client.HTTPConnection("localhost", self.server_port, timeout=0.5)
+        try:
+            deadline = time.monotonic() + timeout
+            # The server runs on localhost, so start with a short poll interval
+            # and back off exponentially while it is still starting.
+            poll_interval = 0.05
             while True:
-                with contextlib.suppress(requests.RequestException):
-                    response = http_session.get(self.server_url + "/_stcore/health")
-                    if response.text == "ok":
+                try:
+                    connection.request("GET", "/_stcore/health")
+                    if connection.getresponse().read() == b"ok":
                         return True
-                time.sleep(3)
-                if time.time() - start_time > 60 * timeout:
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     return False
+                time.sleep(min(poll_interval, remaining))
+                poll_interval = min(poll_interval * 2, 1.0)
+        finally:
+            connection.close()
 
     @property
     def server_url(self) -> str:
@@ -9,17 +9,13 @@ from e2e_utils import StreamlitRunner
 ROOT_DIRECTORY = Path(__file__).parent.parent.absolute()
 BASIC_EXAMPLE_FILE = ROOT_DIRECTORY / "custom_dataframe" / "example.py"
 
-@pytest.fixture(autouse=True, scope="module")
-def streamlit_app():
-    with StreamlitRunner(BASIC_EXAMPLE_FILE) as runner:
-        yield runner
-
 
 @pytest.fixture(autouse=True, scope="function")
 def go_to_app(page: Page, streamlit_app: StreamlitRunner):
-    page.goto(streamlit_app.server_url)
+    page.goto(streamlit_app.server_url, wait_until="domcontentloaded")
     # Wait for app to load
-    page.get_by_role("img", name="Running...").is_hidden()
+    page.get_by_role("img", name="Running...").wait_for(state="hidden")
+    page.frame_locator("iframe").first.locator("body").wait_for(state="visible")
 
 
 def test_should_render_dataframe(page: Page):
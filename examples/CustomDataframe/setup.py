@@ -24,9 +24,9 @@ setuptools.setup(
             "wheel",
             "pytest==7.4.0",
             "playwright==1.48.0",
-            "requests==2.31.0",
             "pytest-playwright-snapshot==1.0",
             "pytest-rerunfailures==12.0",
+            "pytest-xdist==3.3.1",
         ]
     }
 )
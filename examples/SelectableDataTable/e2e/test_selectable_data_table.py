@@ -9,17 +9,13 @@ from e2e_utils import StreamlitRunner
 ROOT_DIRECTORY = Path(__file__).parent.parent.absolute()
 BASIC_EXAMPLE_FILE = ROOT_DIRECTORY / "selectable_data_table" / "example.py"
 
-@pytest.fixture(autouse=True, scope="module")
-def streamlit_app():
-    with StreamlitRunner(BASIC_EXAMPLE_FILE) as runner:
-        yield runner
-
 
 @pytest.fixture(autouse=True, scope="function")
 def go_to_app(page: Page, streamlit_app: StreamlitRunner):
-    page.goto(streamlit_app.server_url)
+    page.goto(streamlit_app.server_url, wait_until="domcontentloaded")
     # Wait for app to load
-    page.get_by_role("img", name="Running...").is_hidden()
+    page.get_by_role("img", name="Running...").wait_for(state="hidden")
+    page.frame_locator("iframe").first.locator("body").wait_for(state="visible")
 
 
 def test_should_render_selectable_data_table(page: Page):
@@ -27,24 +23,14 @@ def test_should_render_selectable_data_table(page: Page):
         'iframe[title="selectable_data_table\\.selectable_data_table"]'
     )
 
-    expect(frame.get_by_role('checkbox')).to_have_count(6)
-    root_checkbox = frame.get_by_role('checkbox').nth(0)
-    first_row_checkbox = frame.get_by_role('checkbox').nth(1)
-    second_row_checkbox = frame.get_by_role('checkbox').nth(2)
-    third_row_checkbox = frame.get_by_role('checkbox').nth(3)
-    fourth_row_checkbox = frame.get_by_role('checkbox').nth(4)
-    fifth_row_checkbox = frame.get_by_role('checkbox').nth(5)
-    none_root_checkboxes = [
-        first_row_checkbox,
-        second_row_checkbox,
-        third_row_checkbox,
-        fourth_row_checkbox,
-        fifth_row_checkbox
-    ]
+    checkboxes = frame.get_by_role('checkbox')
+    expect(checkboxes).to_have_count(6)
+    root_checkbox, *none_root_checkboxes = [checkboxes.nth(i) for i in range(6)]
+    first_row_checkbox = none_root_checkboxes[0]
+    checked_checkboxes = frame.locator('input[type="checkbox"]:checked')
 
     root_checkbox.check()
-    for checkbox in none_root_checkboxes:
-        expect(checkbox).to_be_checked()
+    expect(checked_checkboxes).to_have_count(6)
 
     first_row_checkbox.uncheck()
     expect(root_checkbox).not_to_be_checked()
@@ -53,11 +39,11 @@ def test_should_render_selectable_data_table(page: Page):
     for checkbox in none_root_checkboxes:
         checkbox.uncheck()
 
-    expect(root_checkbox).not_to_be_checked()
+    expect(checked_checkboxes).to_have_count(0)
     expect(root_checkbox).to_have_attribute('data-indeterminate', 'false')
 
     for checkbox in none_root_checkboxes:
         checkbox.check()
 
-    expect(root_checkbox).to_be_checked()
+    expect(checked_checkboxes).to_have_count(6)
     expect(root_checkbox).to_have_attribute('data-indeterminate', 'false')
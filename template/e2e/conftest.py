@@ -0,0 +1,45 @@
+import pytest
+
+from e2e_utils import StreamlitRunner
+
+
+@pytest.fixture(scope="session")
+def streamlit_runners():
+    """Streamlit servers shared across test modules, keyed by script path."""
+    runners = {}
+    yield runners
+    for runner in runners.values():
+        runner.stop()
+
+
+@pytest.fixture(scope="module")
+def streamlit_app(request, streamlit_runners):
+    """Return a running Streamlit server for the module's BASIC_EXAMPLE_FILE.
+
+    The server is started on first use and reused by every other module
+    that runs the same script until the end of the test session.
+    """
+    script_path = request.module.BASIC_EXAMPLE_FILE
+    runner = streamlit_runners.get(script_path)
+    if runner is None:
+        runner = StreamlitRunner(script_path)
+        runner.start()
+        streamlit_runners[script_path] = runner
+    return runner
+
+
+@pytest.fixture(scope="session")
+def browser_context(browser, browser_context_args):
+    """A browser context shared by all tests run against the same browser."""
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(browser_context):
+    """Override pytest-playwright's page to open it in the shared context."""
+    page = browser_context.new_page()
+    yield page
+    page.close()
+    browser_context.clear_cookies()